@@ -1,3 +1,5 @@
+import ibis
+from functools import lru_cache
 from sqlmesh import macro
 from ibis.expr.operations import Namespace, UnboundTable
 
@@ -14,18 +16,86 @@ def generate_ibis_table(
     This macro generates an ibis table expression based on the provided parameters.
     Note: For DuckDB, the "database" parameter in Ibis's "Namespace" class corresponds to the table schema, hence schema_name is used for "database".
     """
-    try:
-        if not table_name or not schema_name or not column_schema:
-            raise ValueError(
-                "table_name, schema_name, and column_schema are required parameters"
-            )
+    if not table_name or not schema_name or not column_schema:
+        raise ValueError(
+            "table_name, schema_name, and column_schema are required parameters"
+        )
 
+    try:
         table = UnboundTable(
             name=table_name,
             schema=column_schema,
             namespace=Namespace(catalog=catalog_name, database=schema_name),
         ).to_expr()
-
-        return table
     except Exception as e:
-        raise RuntimeError(f"Failed to create ibis table: {str(e)}")
+        raise RuntimeError(f"Failed to create ibis table: {str(e)}") from e
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def compile_labelled_indicators_sql(
+    schema_name: str, data_national_schema: tuple, label_schema: tuple
+) -> str:
+    """
+    Compile the data_national/label join behind the OPRI and SDG indicator models.
+    Schemas are passed as tuples of (column, type) pairs; the SQL only depends on them, so each
+    distinct set of schemas is compiled once per process.
+    """
+    data_national = generate_ibis_table(
+        None,
+        table_name="data_national",
+        column_schema=dict(data_national_schema),
+        schema_name=schema_name,
+    )
+
+    label = generate_ibis_table(
+        None,
+        table_name="label",
+        column_schema=dict(label_schema),
+        schema_name=schema_name,
+    )
+
+    indicators = (
+        data_national.left_join(label, "indicator_id")
+        .select(
+            "indicator_id",
+            "country_id",
+            "year",
+            "value",
+            "magnitude",
+            "qualifier",
+            "indicator_label_en",
+        )
+        .rename(indicator_description="indicator_label_en")
+    )
+
+    return ibis.to_sql(indicators)
+
+
+@lru_cache(maxsize=None)
+def compile_indicators_union_sql(source_schemas: tuple) -> str:
+    """
+    Compile the UNION ALL of the sources.<source> indicator tables behind master.indicators.
+    source_schemas holds (source, ((column, type), ...)) pairs; as above, each distinct value is
+    compiled once per process.
+    """
+    tables = []
+    for source, column_schema in source_schemas:
+        # Generate table for this source
+        table = generate_ibis_table(
+            None,
+            table_name=source,
+            schema_name="sources",
+            column_schema=dict(column_schema),
+        )
+        # Add source column
+        tables.append(table.mutate(source=ibis.literal(source)))
+
+    # Union all tables
+    if not tables:
+        raise ValueError("No indicator models found")
+
+    # Sources are disjoint by the source column, so no dedup is needed
+    return ibis.to_sql(ibis.union(*tables, distinct=False))
+
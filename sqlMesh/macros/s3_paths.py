@@ -13,6 +13,7 @@ Key features:
 
 import os
 import typing as t
+from functools import lru_cache
 
 from sqlglot import exp
 from sqlmesh import macro
@@ -48,6 +49,28 @@ def parse_fully_qualified_name(
     return database, schema, table
 
 
+@lru_cache(maxsize=None)
+def resolve_s3_env(default_target: str) -> t.Tuple[str, str]:
+    """Resolve the S3 bucket and environment path segment.
+
+    Environment variables don't change during a SQLMesh run, so they are read
+    once per process rather than on every macro call.
+
+    Args:
+        default_target: Target to use when TARGET is not set
+
+    Returns:
+        A tuple of (bucket, env_path)
+    """
+    bucket = os.environ.get("S3_BUCKET_NAME", "osaa-mvp")
+    target = os.environ.get("TARGET", default_target).lower()
+    username = os.environ.get("USERNAME", "default").lower()
+
+    # Construct the environment path segment
+    env_path = target if target == "prod" else f"dev/{target}_{username}"
+    return bucket, env_path
+
+
 @macro()
 def s3_landing_path(
     evaluator: t.Any, subfolder_filename: t.Union[str, exp.Expression]
@@ -61,12 +84,7 @@ def s3_landing_path(
     Returns:
         S3 path as a SQLGlot literal expression
     """
-    bucket = os.environ.get("S3_BUCKET_NAME", "osaa-mvp")
-    target = os.environ.get("TARGET", "prod").lower()
-    username = os.environ.get("USERNAME", "default").lower()
-
-    # Construct the environment path segment
-    env_path = target if target == "prod" else f"dev/{target}_{username}"
+    bucket, env_path = resolve_s3_env("prod")
 
     # Convert input to string if it's a SQLGlot expression
     if isinstance(subfolder_filename, exp.Expression):
@@ -89,12 +107,7 @@ def s3_transformed_path(
     Returns:
         S3 path as a SQLGlot literal expression
     """
-    bucket = os.environ.get("S3_BUCKET_NAME", "osaa-mvp")
-    target = os.environ.get("TARGET", "dev").lower()
-    username = os.environ.get("USERNAME", "default").lower()
-
-    # Construct the environment path segment
-    env_path = target if target == "prod" else f"dev/{target}_{username}"
+    bucket, env_path = resolve_s3_env("dev")
 
     _, schema, table = parse_fully_qualified_name(fqtn)
     path = f"s3://{bucket}/{env_path}/staging/{schema}/{table}.parquet"
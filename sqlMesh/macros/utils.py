@@ -1,11 +1,49 @@
 from sqlmesh import macro
+from sqlmesh.core.dialect import Model, parse
+from sqlglot.errors import ParseError
+import logging
 import re
 from constants import SQLMESH_DIR
 import os
+from functools import lru_cache
 from typing import Union
 
+# DuckDB base type -> Ibis type name
+TYPE_MAPPING = {
+    "TEXT": "String",
+    "VARCHAR": "String",
+    "CHAR": "String",
+    "INT": "Int",
+    "INTEGER": "Int",
+    "BIGINT": "Int",
+    "DECIMAL": "Decimal",
+    "NUMERIC": "Decimal",
+}
+
+# Exact type spellings (upper and lower case) for a lookup with no string
+# normalisation; anything else falls back to parsing the base type
+TYPE_LOOKUP = {
+    **TYPE_MAPPING,
+    **{type_name.lower(): ibis_type for type_name, ibis_type in TYPE_MAPPING.items()},
+}
+
+# Fallback regular expressions, used only when the MODEL block can't be parsed
+# Regular expression to match the MODEL section
+MODEL_PATTERN = re.compile(
+    r"MODEL\s*\([\s\S]*?columns\s*\(\s*([\s\S]*?)\s*\)[\s\S]*?\)", re.IGNORECASE
+)
+
+# Regular expression to extract column name and type
+# This pattern accounts for column names with spaces, assuming they are quoted
+COLUMN_PATTERN = re.compile(r'"?([\w\s]+)"?\s+(\w+)', re.IGNORECASE)
+
 
 def convert_duckdb_type_to_ibis(duckdb_type):
+    # Fast path for plain type names such as TEXT or decimal
+    ibis_type = TYPE_LOOKUP.get(str(duckdb_type))
+    if ibis_type is not None:
+        return ibis_type
+
     # Convert to string and uppercase for consistency
     type_str = str(duckdb_type).upper()
 
@@ -13,17 +51,71 @@ def convert_duckdb_type_to_ibis(duckdb_type):
     # Handling dtype such as DECIMAL(18,3)
     base_type = type_str.split("(")[0].strip()
 
-    type_mapping = {
-        "TEXT": "String",
-        "VARCHAR": "String",
-        "CHAR": "String",
-        "INT": "Int",
-        "INTEGER": "Int",
-        "BIGINT": "Int",
-        "DECIMAL": "Decimal",
-        "NUMERIC": "Decimal",
+    return TYPE_MAPPING.get(base_type, "String")  # Default to String if unknown
+
+
+def _parse_model_columns(sql_content: str):
+    """Extract (name, type) pairs from the MODEL columns property.
+
+    Uses SQLMesh's dialect parser, which handles quoted identifiers and
+    parameterised types without regex backtracking.
+
+    Returns:
+        List of (column_name, duckdb_type) tuples, or None if the content
+        doesn't start with a MODEL block.
+    """
+    expressions = parse(sql_content, default_dialect="duckdb")
+    if not expressions or not isinstance(expressions[0], Model):
+        return None
+
+    for prop in expressions[0].expressions:
+        if prop.text("this").lower() == "columns":
+            schema = prop.args.get("value")
+            return [
+                (column.name, column.args["kind"].sql(dialect="duckdb"))
+                for column in schema.expressions
+            ]
+
+    return []
+
+
+def _regex_model_columns(sql_content: str):
+    """Extract (name, type) pairs from the MODEL block with regular expressions."""
+    match = MODEL_PATTERN.search(sql_content)
+
+    if not match:
+        return []
+
+    columns_section = match.group(1)
+
+    return COLUMN_PATTERN.findall(columns_section)
+
+
+@lru_cache(maxsize=None)
+def _parse_sql_model_schema(file_path: str, mtime: float) -> dict:
+    """Parse the column schema out of a SQL model file.
+
+    Cached per (file_path, mtime) so each model file is read and parsed once
+    per process, and re-parsed only if the file changes on disk.
+    """
+    with open(file_path, "r") as file:
+        sql_content = file.read()
+
+    try:
+        columns = _parse_model_columns(sql_content)
+    except ParseError:
+        columns = None
+
+    if columns is None:
+        columns = _regex_model_columns(sql_content)
+
+    # Convert list of tuples to dictionary
+    columns_dict = {
+        name.strip().lower(): convert_duckdb_type_to_ibis(str(col_type))
+        for name, col_type in columns
     }
-    return type_mapping.get(base_type, "String")  # Default to String if unknown
+
+    return columns_dict
 
 
 @macro()
@@ -37,32 +129,30 @@ def get_sql_model_schema(evaluator, sql_file_name, folder_path_from_models_folde
                                       The path should match the source data folder
     """
     file_path = f"{SQLMESH_DIR}/models/sources/{folder_path_from_models_folder}/{sql_file_name.lower()}.sql"
-    with open(file_path, "r") as file:
-        sql_content = file.read()
-
-    # Regular expression to match the MODEL section
-    model_pattern = re.compile(
-        r"MODEL\s*\([\s\S]*?columns\s*\(\s*([\s\S]*?)\s*\)[\s\S]*?\)", re.IGNORECASE
-    )
-    match = model_pattern.search(sql_content)
 
-    if not match:
-        return {}
+    # Return a copy so callers can't mutate the cached schema
+    return dict(_parse_sql_model_schema(file_path, os.path.getmtime(file_path)))
 
-    columns_section = match.group(1)
 
-    # Regular expression to extract column name and type
-    # This pattern now accounts for column names with spaces, assuming they are quoted
-    column_pattern = re.compile(r'"?([\w\s]+)"?\s+(\w+)', re.IGNORECASE)
-    columns = column_pattern.findall(columns_section)
+def dev_row_limit(env_var: str) -> int:
+    """Return the row limit for dev renders, or 0 for no limit.
 
-    # Convert list of tuples to dictionary
-    columns_dict = {
-        name.strip().lower(): convert_duckdb_type_to_ibis(str(col_type))
-        for name, col_type in columns
-    }
+    Reads the limit from env_var; it only applies when TARGET isn't prod.
+    """
+    if os.getenv("TARGET", "dev").lower() == "prod":
+        return 0
 
-    return columns_dict
+    # Models are rendered while the SQLMesh context loads, so a malformed
+    # value must not raise: warn and render the full table instead
+    value = os.getenv(env_var, "0")
+    try:
+        row_limit = int(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Ignoring %s=%r: not an integer, no row limit applied", env_var, value
+        )
+        return 0
+    return max(row_limit, 0)
 
 
 def get_s3_path(subfolder_filename: Union[str, str]) -> str:
@@ -33,20 +33,28 @@ def process_edu_data(
     Returns:
         Processed Ibis table or None if processing fails
     """
-    if data not in connection.list_tables() or label not in connection.list_tables():
+    existing_tables = set(connection.list_tables())
+    if data not in existing_tables or label not in existing_tables:
         logger.error(
-            f"Skipping {dataset_name.upper()} processing as one or both tables do not exist."
+            "Skipping %s processing as one or both tables do not exist.",
+            dataset_name.upper(),
         )
         return None
 
     try:
         logger.info(
-            f"Processing {dataset_name.upper()} data from tables '{data}' and '{label}'..."
+            "Processing %s data from tables '%s' and '%s'...",
+            dataset_name.upper(),
+            data,
+            label,
         )
 
         tdata = connection.table(data).rename("snake_case")
         tlabel = connection.table(label).rename("snake_case")
 
+        # Filter on year before the join so fewer rows reach the join
+        tdata = tdata.filter(tdata.year > 1999)
+
         processed = (
             tdata.join(tlabel, tdata.indicator_id == tlabel.indicator_id, how="left")
             .select(
@@ -57,16 +65,17 @@ def process_edu_data(
                 indicator_label="indicator_label_en",
             )
             .mutate(database=ibis.literal(dataset_name))
-            .filter(ibis._.year > 1999)
         )
 
         logger.info(
-            f"{dataset_name.upper()} data from tables "
-            f"'{data}' and '{label}' successfully processed."
+            "%s data from tables '%s' and '%s' successfully processed.",
+            dataset_name.upper(),
+            data,
+            label,
         )
 
         return processed
 
     except Exception as e:
-        logger.error(f"Error processing {dataset_name.upper()} data: {e}")
+        logger.error("Error processing %s data: %s", dataset_name.upper(), e)
         return None
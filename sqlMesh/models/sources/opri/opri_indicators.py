@@ -1,7 +1,6 @@
-import ibis
 from sqlmesh.core.macros import MacroEvaluator
 from sqlmesh.core.model import model
-from macros.ibis_expressions import generate_ibis_table
+from macros.ibis_expressions import compile_labelled_indicators_sql
 from macros.utils import get_sql_model_schema
 
 COLUMN_SCHEMA = {
@@ -18,38 +17,15 @@ COLUMN_SCHEMA = {
 @model(
     "sources.opri",
     is_sql=True,
-    kind="FULL",
+    kind="VIEW",
     columns=COLUMN_SCHEMA,
 )
 def entrypoint(evaluator: MacroEvaluator) -> str:
     source_folder_path = "opri"
 
-    opri_data_national = generate_ibis_table(
-        evaluator,
-        table_name="data_national",
-        column_schema=get_sql_model_schema(evaluator, "data_national", source_folder_path),
-        schema_name="opri",
+    # Compiled once per distinct pair of source schemas
+    return compile_labelled_indicators_sql(
+        source_folder_path,
+        tuple(get_sql_model_schema(evaluator, "data_national", source_folder_path).items()),
+        tuple(get_sql_model_schema(evaluator, "label", source_folder_path).items()),
     )
-
-    opri_label = generate_ibis_table(
-        evaluator,
-        table_name="label",
-        column_schema=get_sql_model_schema(evaluator, "label", source_folder_path),
-        schema_name="opri",
-    )
-
-    opri_table = (
-        opri_data_national.left_join(opri_label, "indicator_id")
-        .select(
-            "indicator_id",
-            "country_id",
-            "year",
-            "value",
-            "magnitude",
-            "qualifier",
-            "indicator_label_en",
-        )
-        .rename(indicator_description="indicator_label_en")
-    )
-
-    return ibis.to_sql(opri_table)
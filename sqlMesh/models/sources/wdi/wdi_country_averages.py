@@ -1,10 +1,8 @@
 from sqlmesh.core.macros import MacroEvaluator
 from sqlmesh import model
-import ibis
 import os
-from macros.ibis_expressions import generate_ibis_table
 from macros.s3_paths import s3_transformed_path
-from models.sources.wdi.wdi_indicators import COLUMN_SCHEMA as WDI_COLUMN_SCHEMA
+from macros.utils import dev_row_limit
 
 COLUMN_SCHEMA = {
     "country_id": "String",
@@ -17,6 +15,27 @@ COLUMN_SCHEMA = {
     "avg_value_by_country": "Float",
 }
 
+# Per-country/indicator average as a window over a single scan of sources.wdi,
+# keeping only groups with at least one non-null value
+COUNTRY_AVERAGES_SQL = """
+    SELECT
+        country_id,
+        indicator_id,
+        year,
+        value,
+        magnitude,
+        qualifier,
+        indicator_description,
+        avg_value_by_country
+    FROM (
+        SELECT
+            *,
+            AVG(value) OVER (PARTITION BY country_id, indicator_id) AS avg_value_by_country
+        FROM osaa_mvp.sources.wdi
+    ) AS wdi
+    WHERE avg_value_by_country IS NOT NULL
+"""
+
 # For post statement
 SCHEMA_TO_COPY_FROM = (
     "" if os.getenv("TARGET") == "prod" else f"__{os.getenv('TARGET')}"
@@ -40,28 +59,9 @@ SCHEMA_TO_COPY_FROM = (
     ],
 )
 def entrypoint(evaluator: MacroEvaluator) -> str:
-    wdi = generate_ibis_table(
-        evaluator,
-        table_name="wdi",
-        schema_name="sources",
-        column_schema=WDI_COLUMN_SCHEMA,
-    )
-
-    country_averages = (
-        wdi.filter(wdi.value.notnull())
-        .group_by(["country_id", "indicator_id"])
-        .agg(avg_value_by_country=wdi.value.mean())
-        .join(wdi, ["country_id", "indicator_id"])
-        .select(
-            "country_id",
-            "indicator_id",
-            "year",
-            "value",
-            "magnitude",
-            "qualifier",
-            "indicator_description",
-            "avg_value_by_country"
-        )
-    )
-
-    return ibis.to_sql(country_averages)
+    # Optional row cap to keep dev renders fast (WDI_DEV_LIMIT, non-prod only),
+    # ordered on the country/indicator/year key so every run gets the same rows
+    row_limit = dev_row_limit("WDI_DEV_LIMIT")
+    if row_limit > 0:
+        return f"{COUNTRY_AVERAGES_SQL}ORDER BY country_id, indicator_id, year\nLIMIT {row_limit}"
+    return COUNTRY_AVERAGES_SQL
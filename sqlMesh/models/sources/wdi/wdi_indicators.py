@@ -1,9 +1,6 @@
-import ibis
-import ibis.selectors as s
 from sqlmesh.core.macros import MacroEvaluator
 from sqlmesh import model
-from macros.ibis_expressions import generate_ibis_table
-from macros.utils import get_sql_model_schema
+from macros.utils import dev_row_limit, get_sql_model_schema
 
 
 COLUMN_SCHEMA = {
@@ -24,47 +21,39 @@ COLUMN_SCHEMA = {
     columns=COLUMN_SCHEMA,
 )
 def entrypoint(evaluator: MacroEvaluator) -> str:
-    """Process WDI data and return the transformed Ibis table."""
+    """Process WDI data and return the transformed SQL query."""
 
     source_folder_path = "wdi"
-    wdi_csv = generate_ibis_table(
-        evaluator,
-        table_name="csv",
-        column_schema=get_sql_model_schema(evaluator, "csv", source_folder_path),
-        schema_name="wdi",
-    )
-
-    wdi_data = (
-        wdi_csv.rename("snake_case")
-        .rename(country_id="country_code", indicator_id="indicator_code")
-        .select("country_id", "indicator_id", s.numeric())
-        .pivot_longer(s.index["1960":], names_to="year", values_to="value")
-        .cast({"year": "int64", "value": "decimal"})
-    )
-
-    wdi_series = generate_ibis_table(
-        evaluator,
-        table_name="series",
-        column_schema=get_sql_model_schema(evaluator, "series", source_folder_path),
-        schema_name="wdi",
-    )
-
-    wdi_series_renamed = (
-        wdi_series
-        .rename("snake_case")
-        .rename(indicator_id="series_code")
-    )
-
-    wdi = (
-        wdi_data.join(
-            wdi_series_renamed,
-            "indicator_id"
-        )
-        .mutate(
-            magnitude=ibis.literal(""),  # Empty string for now
-            qualifier=ibis.literal(""),  # Empty string for now
-            indicator_description=wdi_series_renamed["long_definition"]
-        )
-    )
-
-    return ibis.to_sql(wdi)
+    csv_schema = get_sql_model_schema(evaluator, "csv", source_folder_path)
+
+    # One column per year ("1960", "1961", ...) in the wide WDI CSV
+    year_columns = ", ".join(f'"{column}"' for column in csv_schema if column.isdigit())
+
+    # Unpivot the year columns into year/value rows with DuckDB's native
+    # UNPIVOT, keeping NULL values so every country/indicator/year is present
+    sql = f"""
+        SELECT
+            wdi_data.country_id,
+            wdi_data.indicator_id,
+            CAST(wdi_data.year AS BIGINT) AS year,
+            CAST(wdi_data.value AS DECIMAL(18, 3)) AS value,
+            '' AS magnitude,
+            '' AS qualifier,
+            wdi_series."Long definition" AS indicator_description
+        FROM (
+            SELECT
+                "Country Code" AS country_id,
+                "Indicator Code" AS indicator_id,
+                {year_columns}
+            FROM osaa_mvp.wdi.csv
+        ) UNPIVOT INCLUDE NULLS (value FOR year IN ({year_columns})) AS wdi_data
+        INNER JOIN osaa_mvp.wdi.series AS wdi_series
+            ON wdi_data.indicator_id = wdi_series."Series Code"
+    """
+
+    # Optional row cap to keep dev renders fast (WDI_DEV_LIMIT, non-prod only),
+    # ordered on the country/indicator/year key so every run gets the same rows
+    row_limit = dev_row_limit("WDI_DEV_LIMIT")
+    if row_limit > 0:
+        return f"{sql}ORDER BY country_id, indicator_id, year\nLIMIT {row_limit}"
+    return sql
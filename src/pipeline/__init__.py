@@ -14,6 +14,11 @@ def setup_package_logging() -> logging.Logger:
     """Set up comprehensive logging for the pipeline package."""
     # Create a package-level logger
     logger = logging.getLogger(__name__)
+
+    # Already set up by an earlier call
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.INFO)
 
     # Create console handler
@@ -32,12 +37,13 @@ def setup_package_logging() -> logging.Logger:
     return logger
 
 
-# Initialize package logging
-logger = setup_package_logging()
-
-
 def init_pipeline_package() -> None:
-    """Initialize the pipeline package and log package details."""
+    """Initialize the pipeline package and log package details.
+
+    Called once by the pipeline entrypoints rather than on package import,
+    which is also when the package logging handler is attached.
+    """
+    logger = setup_package_logging()
     logger.info("🚀 Initializing OSAA MVP Pipeline Package")
     logger.info("   🌐 United Nations OSAA MVP Data Processing Pipeline")
     logger.info("   📦 Modules:")
@@ -48,7 +54,3 @@ def init_pipeline_package() -> None:
     # Log package path for debugging
     package_path = os.path.dirname(os.path.abspath(__file__))
     logger.info(f"   📂 Package Path: {package_path}")
-
-
-# Call initialization when the package is imported
-init_pipeline_package()
@@ -14,6 +14,25 @@ from pipeline.logging_config import create_logger, log_exception
 logger = create_logger(__name__)
 
 
+def _write_parquet(table_exp: ibis.Expr, path: str) -> None:
+    """Stream the Ibis table expression to a Parquet file with DuckDB's COPY.
+
+    Args:
+        table_exp: Ibis table expression to be written.
+        path: Local or S3 path of the Parquet file.
+    """
+    con = table_exp._find_backend()
+    if path.startswith("s3://"):
+        con.load_extension("httpfs")
+
+    sql = con.compile(table_exp)
+    escaped_path = path.replace("'", "''")
+    con.raw_sql(
+        f"COPY ({sql}) TO '{escaped_path}' "
+        "(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)"
+    )
+
+
 def save_s3(table_exp: ibis.Expr, s3_path: str) -> None:
     """Save the Ibis table expression to S3 as a Parquet file.
 
@@ -22,7 +41,7 @@ def save_s3(table_exp: ibis.Expr, s3_path: str) -> None:
         s3_path: The full S3 path where the Parquet file will be saved.
     """
     try:
-        table_exp.to_parquet(s3_path)
+        _write_parquet(table_exp, s3_path)
         logger.info(f"📤 Table successfully uploaded to S3 path: {s3_path}")
         logger.info(f"   🔍 Table details: {table_exp}")
 
@@ -39,7 +58,8 @@ def save_duckdb(table_exp: ibis.Expr, local_db: Any) -> None:
         local_db: Connection to the local DuckDB database.
     """
     try:
-        local_db.create_table("master", table_exp.execute(), overwrite=True)
+        # Hand DuckDB an Arrow table rather than a pandas DataFrame
+        local_db.create_table("master", table_exp.to_pyarrow(), overwrite=True)
         logger.info("🗄️ Table successfully created in persistent DuckDB")
         logger.info(f"   🔍 Table details: {table_exp}")
 
@@ -56,7 +76,7 @@ def save_parquet(table_exp: ibis.Expr, local_path: str) -> None:
         local_path: Local file path where the Parquet file will be saved.
     """
     try:
-        table_exp.to_parquet(local_path)
+        _write_parquet(table_exp, local_path)
         logger.info(f"💾 Table successfully saved to local Parquet file: {local_path}")
         logger.info(f"   🔍 Table details: {table_exp}")
 
@@ -7,12 +7,12 @@ parameters for the United Nations OSAA MVP project.
 import logging
 import os
 import sys
-
-import boto3
-import colorlog
-from botocore.exceptions import ClientError
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from pipeline.exceptions import ConfigurationError
+from pipeline.logging_config import create_logger
 
 # get the local root directory
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -43,56 +43,121 @@ S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "osaa-mvp")
 LANDING_AREA_FOLDER = f"{S3_ENV}/landing"
 STAGING_AREA_FOLDER = f"{S3_ENV}/staging"
 
+# Full S3 URL prefix for the staging area, built once
+S3_STAGING_URL = f"s3://{S3_BUCKET_NAME}/{STAGING_AREA_FOLDER}"
 
-# Custom Exception for Configuration Errors
-class ConfigurationError(Exception):
-    """Exception raised for configuration-related errors."""
 
-    pass
+@dataclass(frozen=True)
+class _EnvSnapshot:
+    """AWS-related environment variables, read once per process."""
+
+    aws_access_key_id: Optional[str]
+    aws_secret_access_key: Optional[str]
+    aws_session_token: Optional[str]
+    aws_default_region: Optional[str]
+    skip_aws_validation: bool
 
 
-# Logging configuration
-def create_logger():
+@lru_cache(maxsize=1)
+def _load_env() -> _EnvSnapshot:
     """
-    Create a structured, color-coded logger with clean output.
+    Snapshot the AWS environment variables on first use.
 
-    :return: Configured logger instance
+    :return: Cached environment snapshot
     """
-    # Create logger
-    logger = colorlog.getLogger(__name__)
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
-
-    # Remove any existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-
-    # Create console handler
-    console_handler = colorlog.StreamHandler()
-
-    # Custom log format with clear structure
-    formatter = colorlog.ColoredFormatter(
-        # Structured format with clear sections
-        "%(log_color)s[%(levelname)s]%(reset)s "
-        "%(blue)s[%(name)s]%(reset)s "
-        "%(message)s",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-        secondary_log_colors={},
+    return _EnvSnapshot(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        aws_session_token=os.getenv("AWS_SESSION_TOKEN"),
+        aws_default_region=os.getenv("AWS_DEFAULT_REGION"),
+        skip_aws_validation=os.getenv("SKIP_AWS_VALIDATION", "false").lower()
+        == "true",
     )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    return logger
+
+def reset_env_cache():
+    """
+    Drop the cached environment snapshot so the next read sees os.environ.
+
+    Also drops everything built from it: the shared boto3 session, the
+    credential check and the S3 client cached by utils.s3_init.
+    """
+    # utils imports this module, so import it here rather than at the top
+    from pipeline.utils import _cached_s3_client
+
+    _load_env.cache_clear()
+    get_aws_session.cache_clear()
+    ensure_aws_ready.cache_clear()
+    _cached_s3_client.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_boto_client_config():
+    """
+    Return the botocore settings shared by every AWS client the pipeline creates.
+
+    botocore is imported here rather than at module level, so importing this
+    module stays cheap for tools that never talk to AWS.
+
+    The connection pool size can be tuned with S3_POOL_SIZE.
+
+    :return: botocore Config with pooled, keep-alive connections
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=int(os.getenv("S3_POOL_SIZE", "50")),
+        retries={"mode": "adaptive"},
+        tcp_keepalive=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_aws_session():
+    """
+    Return the boto3 session shared by credential validation and S3 clients.
+
+    Temporary credentials (AWS_SESSION_TOKEN) are carried on the session, so
+    the DuckDB S3 secrets built from it get the token too.
+
+    :return: boto3 Session built from the environment snapshot
+    """
+    import boto3
+
+    env = _load_env()
+    return boto3.Session(
+        aws_access_key_id=env.aws_access_key_id,
+        aws_secret_access_key=env.aws_secret_access_key,
+        aws_session_token=env.aws_session_token,
+        region_name=env.aws_default_region or "us-east-1",
+    )
+
+
+# Credential checks run in order by validate_aws_credentials: (predicate, error)
+CREDENTIAL_CHECKS = (
+    (lambda env: env.aws_access_key_id, "Missing AWS credential: AWS_ACCESS_KEY_ID"),
+    (
+        lambda env: env.aws_secret_access_key,
+        "Missing AWS credential: AWS_SECRET_ACCESS_KEY",
+    ),
+    (lambda env: env.aws_default_region, "Missing AWS credential: AWS_DEFAULT_REGION"),
+    (
+        lambda env: len(env.aws_access_key_id) >= 10
+        and len(env.aws_secret_access_key) >= 20,
+        "Incomplete or malformed AWS credentials",
+    ),
+)
+
+
+# Custom Exception for Configuration Errors
+class ConfigurationError(Exception):
+    """Exception raised for configuration-related errors."""
+
+    pass
 
 
 # Global logger instance
-logger = create_logger()
+logger = create_logger(__name__)
 
 
 def validate_config():
@@ -172,12 +237,14 @@ def validate_aws_credentials():
     Performs comprehensive checks:
     - Verifies presence of required environment variables
     - Validates AWS credential format
-    - Attempts S3 client creation
-    - Performs lightweight bucket listing test
+    - Attempts STS client creation
+    - Performs lightweight caller identity test
 
     :raises ConfigurationError: If credentials are invalid or missing
     """
 
+    from botocore.exceptions import ClientError
+
     def _mask_sensitive(value):
         """Mask sensitive information in logs."""
         return "*" * len(value) if value else "NOT SET"
@@ -186,48 +253,36 @@ def validate_aws_credentials():
         # Credential validation stages
         logger.info("Validating AWS Credentials")
 
-        # Check required environment variables
-        required_vars = [
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "AWS_DEFAULT_REGION",
-        ]
-
-        # Log environment variable status
-        logger.debug("Checking Environment Variables:")
-        for var in required_vars:
-            value = os.getenv(var)
-            logger.debug(f"  {var}: {_mask_sensitive(value)}")
-
-        # Validate variable presence
-        for var in required_vars:
-            if not os.getenv(var):
-                raise ConfigurationError(f"Missing AWS credential: {var}")
-
-        # Extract credentials
-        access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
-
-        # Validate credential format
-        if not access_key.startswith("AKIA"):
+        env = _load_env()
+
+        # Log environment variable status, only formatted at DEBUG level
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking Environment Variables:")
+            for var, value in (
+                ("AWS_ACCESS_KEY_ID", env.aws_access_key_id),
+                ("AWS_SECRET_ACCESS_KEY", env.aws_secret_access_key),
+                ("AWS_DEFAULT_REGION", env.aws_default_region),
+            ):
+                logger.debug(f"  {var}: {_mask_sensitive(value)}")
+
+        # Validate presence and format; fail on the first broken check
+        for check, message in CREDENTIAL_CHECKS:
+            if not check(env):
+                raise ConfigurationError(message)
+
+        # Long-term (AKIA) and temporary (ASIA) keys are both standard
+        if not env.aws_access_key_id.startswith(("AKIA", "ASIA")):
             logger.warning("Potential non-standard AWS Access Key ID format")
 
-        if len(access_key) < 10 or len(secret_key) < 20:
-            raise ConfigurationError("Incomplete or malformed AWS credentials")
-
-        # S3 client creation and validation
+        # STS client creation and validation
         try:
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region,
+            sts_client = get_aws_session().client(
+                "sts", config=get_boto_client_config()
             )
 
-            # Lightweight bucket listing test
+            # Constant-size identity check; needs no S3 permissions
             try:
-                s3_client.list_buckets()
+                sts_client.get_caller_identity()
                 logger.info("AWS credentials validated successfully")
 
             except ClientError as list_error:
@@ -241,13 +296,13 @@ def validate_aws_credentials():
                     logger.error(f"Error Details: {error_message}")
                     raise ConfigurationError(detailed_error) from list_error
 
-                # Generic S3 access error
-                logger.error(f"S3 Access Error: {error_message}")
-                raise ConfigurationError(f"S3 Access Failed: {error_message}")
+                # Generic AWS access error
+                logger.error(f"AWS Access Error: {error_message}")
+                raise ConfigurationError(f"AWS Access Failed: {error_message}")
 
         except Exception as client_error:
-            logger.error(f"S3 Client Creation Failed: {client_error}")
-            raise ConfigurationError(f"S3 Client Setup Error: {client_error}")
+            logger.error(f"STS Client Creation Failed: {client_error}")
+            raise ConfigurationError(f"STS Client Setup Error: {client_error}")
 
     except Exception as e:
         # Structured error reporting
@@ -272,9 +327,35 @@ def validate_aws_credentials():
         raise
 
 
-# Validate configuration and AWS credentials when module is imported
-try:
-    validate_config()
-    validate_aws_credentials()
-except ConfigurationError as config_error:
-    sys.exit(1)
+@lru_cache(maxsize=1)
+def ensure_aws_ready():
+    """
+    Validate AWS credentials once per process, before the first S3 use.
+
+    Set SKIP_AWS_VALIDATION=true to skip the AWS round-trip.
+
+    :raises ConfigurationError: If credentials are invalid or missing
+    """
+    if not _load_env().skip_aws_validation:
+        validate_aws_credentials()
+
+
+def validate_environment():
+    """
+    Validate configuration and AWS credentials once per process.
+
+    Called explicitly by the pipeline entrypoints rather than on import, so
+    importing this module stays free of filesystem and network side effects.
+
+    Exits the process if the configuration is invalid.
+    """
+    try:
+        validate_config()
+        ensure_aws_ready()
+    except ConfigurationError:
+        sys.exit(1)
+
+
+# Opt-in import-time validation for tools that rely on the old behaviour
+if os.getenv("OSAA_VALIDATE_ON_IMPORT") == "1":
+    validate_environment()
@@ -80,4 +80,5 @@ def test_configuration() -> None:
 
 # Run the configuration test when the script is executed
 if __name__ == "__main__":
+    config.validate_config()
     test_configuration()
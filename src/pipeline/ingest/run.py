@@ -12,6 +12,7 @@ from botocore.exceptions import ClientError, NoCredentialsError
 import duckdb
 from typing import Dict, Optional
 
+from pipeline import init_pipeline_package
 from pipeline.config import (
     ENABLE_S3_UPLOAD,
     LANDING_AREA_FOLDER,
@@ -19,6 +20,8 @@ from pipeline.config import (
     S3_BUCKET_NAME,
     TARGET,
     USERNAME,
+    ensure_aws_ready,
+    validate_environment,
 )
 from pipeline.exceptions import (
     FileConversionError,
@@ -59,7 +62,8 @@ class Ingest:
         self.con = duckdb.connect()
         if ENABLE_S3_UPLOAD:
             logger.info("Initializing S3 client...")
-            self.s3_client, self.session = s3_init(return_session=True)
+            ensure_aws_ready()
+            self.s3_client, self.session = s3_init()
             logger.info("S3 Client Initialized")
         else:
             logger.warning("S3 upload is disabled")
@@ -93,6 +97,7 @@ class Ingest:
                 TYPE S3,
                 KEY_ID '{credentials.access_key}',
                 SECRET '{credentials.secret_key}',
+                SESSION_TOKEN '{credentials.token or ""}',
                 REGION '{region}'
             );
             """
@@ -137,7 +142,7 @@ class Ingest:
                 f"""
                 COPY (SELECT * FROM {fully_qualified_name})
                 TO '{s3_file_path}'
-                (FORMAT PARQUET)
+                (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)
             """
             )
 
@@ -243,6 +248,8 @@ class Ingest:
 
 
 if __name__ == "__main__":
+    init_pipeline_package()
+    validate_environment()
     try:
         ingest_process = Ingest()
         ingest_process.run()
@@ -13,6 +13,26 @@ from typing import Optional, Union
 import colorlog
 
 
+# Custom log format with clear structure
+CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    "%(log_color)s[%(levelname)s]%(reset)s "
+    "%(blue)s[%(name)s]%(reset)s "
+    "%(message)s",
+    log_colors={
+        "DEBUG": "cyan",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red,bg_white",
+    },
+    secondary_log_colors={},
+)
+
+# Console handler with color, shared by every pipeline logger
+CONSOLE_HANDLER = colorlog.StreamHandler(sys.stdout)
+CONSOLE_HANDLER.setFormatter(CONSOLE_FORMATTER)
+
+
 def create_logger(
     name: Optional[str] = None,
     log_level: Union[int, str] = logging.INFO,
@@ -30,33 +50,16 @@ def create_logger(
     """
     # Create logger
     logger = colorlog.getLogger(name or __name__)
+
+    # Reuse a logger that has already been configured
+    if logger.handlers:
+        return logger
+
     logger.setLevel(log_level)
     logger.propagate = False
 
-    # Remove any existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-
-    # Create console handler with color
-    console_handler = colorlog.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-
-    # Custom log format with clear structure
-    formatter = colorlog.ColoredFormatter(
-        "%(log_color)s[%(levelname)s]%(reset)s "
-        "%(blue)s[%(name)s]%(reset)s "
-        "%(message)s",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-        secondary_log_colors={},
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Attach the shared color console handler; the logger level does the filtering
+    logger.addHandler(CONSOLE_HANDLER)
 
     # Optional file logging
     if log_dir or log_file:
@@ -1,6 +1,10 @@
+from typing import List, Optional, Tuple
+
 import duckdb
 
 import pipeline.config as config
+from pipeline import init_pipeline_package
+from pipeline.exceptions import S3ConfigurationError
 from pipeline.logging_config import create_logger
 from pipeline.utils import s3_init
 
@@ -26,10 +30,13 @@ class Upload:
         logger.info(f"   Environment Target: {config.TARGET}")
         logger.info(f"   Database Path: {config.DB_PATH}")
 
-        self.s3_client, self.session = s3_init(return_session=True)
+        config.ensure_aws_ready()
+        self.s3_client, self.session = s3_init()
         logger.info("   ✅ S3 Client Initialized")
 
         self.con = duckdb.connect(config.DB_PATH)
+        # Exports don't need row order, which lets DuckDB write in parallel
+        self.con.execute("SET preserve_insertion_order = false")
         self.env = config.TARGET
 
     def setup_s3_secret(self) -> None:
@@ -53,6 +60,7 @@ class Upload:
                 TYPE S3,
                 KEY_ID '{credentials.access_key}',
                 SECRET '{credentials.secret_key}',
+                SESSION_TOKEN '{credentials.token or ""}',
                 REGION '{region}'
             );
             """
@@ -105,43 +113,76 @@ class Upload:
         # Format the fully qualified table name with environment
         fully_qualified_name = f"{schema_name}.{table_name}"
 
-        # Use the correct fully qualified name in the query
-        self.con.sql(
-            f"""
-            COPY (SELECT * FROM {fully_qualified_name})
-            TO '{s3_file_path}'
-            (FORMAT 'parquet', OVERWRITE_OR_IGNORE 1);
-        """
+        # COPY can't bind its target as a parameter, so quote the identifiers
+        # and escape the path literal instead of interpolating them raw
+        quoted_name = ".".join(
+            '"' + part.replace('"', '""') + '"' for part in (schema_name, table_name)
         )
+        quoted_path = "'" + s3_file_path.replace("'", "''") + "'"
+
+        try:
+            self.con.execute(
+                f"""
+                COPY (SELECT * FROM {quoted_name})
+                TO {quoted_path}
+                (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 122880, OVERWRITE_OR_IGNORE 1);
+            """
+            )
+        except duckdb.HTTPException as e:
+            # Credentials are no longer probed up front, so report S3 auth
+            # failures here with the same guidance
+            raise S3ConfigurationError(
+                f"S3 access failed while uploading to {s3_file_path}: {e}. "
+                "Verify AWS credentials and IAM permissions."
+            ) from e
         logger.info(f"Successfully uploaded {fully_qualified_name} to {s3_file_path}")
 
-    def run(self):
+    def get_upload_targets(self) -> List[Tuple[str, str, str]]:
+        """
+        Map every discovered SQLMesh model to its S3 staging path.
+
+        :return: List of tuples (schema, table, s3_path)
+        """
+        upload_targets = []
+        for schema, table in self.get_sqlmesh_models():
+            # Extract schema name without environment suffix (e.g., "__dev" or "__prod")
+            base_schema = schema.split('__')[0]
+
+            # Special case for indicators table
+            if table == "indicators":
+                s3_path = f"{config.S3_STAGING_URL}/master/{table}.parquet"
+            else:
+                s3_path = f"{config.S3_STAGING_URL}/source/{base_schema}/{table}.parquet"
+            upload_targets.append((schema, table, s3_path))
+
+        return upload_targets
+
+    def run(self, targets: Optional[List[Tuple[str, str, str]]] = None):
         """
         Execute the full upload process.
+
+        All tables are exported on the one open connection and S3 secret,
+        inside a single transaction so they come from the same snapshot.
+
+        :param targets: (schema, table, s3_path) tuples to upload; defaults to
+            every discovered SQLMesh model
         """
         try:
             # Set up S3 secret in DuckDB
             self.setup_s3_secret()
 
-            # Dynamically get SQLMesh models
-            sqlmesh_models = self.get_sqlmesh_models()
-
-            # Define upload targets dynamically
-            upload_targets = []
-            for schema, table in sqlmesh_models:
-                # Extract schema name without environment suffix (e.g., "__dev" or "__prod")
-                base_schema = schema.split('__')[0]
-                
-                # Special case for indicators table
-                if table == "indicators":
-                    s3_path = f"s3://{config.S3_BUCKET_NAME}/{config.STAGING_AREA_FOLDER}/master/{table}.parquet"
-                else:
-                    s3_path = f"s3://{config.S3_BUCKET_NAME}/{config.STAGING_AREA_FOLDER}/source/{base_schema}/{table}.parquet"
-                upload_targets.append((schema, table, s3_path))
+            # Dynamically get SQLMesh models unless targets were given
+            upload_targets = targets if targets is not None else self.get_upload_targets()
 
             # Execute uploads
-            for schema, table, s3_path in upload_targets:
-                self.upload(schema, table, s3_path)
+            self.con.begin()
+            try:
+                for schema, table, s3_path in upload_targets:
+                    self.upload(schema, table, s3_path)
+                self.con.commit()
+            except Exception:
+                self.con.rollback()
+                raise
 
             logger.info("Upload process completed successfully.")
             logger.info(f"Uploaded {len(upload_targets)} models to S3")
@@ -150,7 +191,8 @@ class Upload:
             logger.error(f"Upload process failed: {e}")
             raise
 
-
 if __name__ == "__main__":
+    init_pipeline_package()
+    config.validate_environment()
     upload_process = Upload()
     upload_process.run()
@@ -1,35 +1,79 @@
 import functools
+import logging
 import os
+import random
 import re
 import time
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, Tuple
 
-import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
+from pipeline.config import _load_env, get_aws_session, get_boto_client_config
 from pipeline.logging_config import create_logger, log_exception
 
+# Characters replaced with "_" by standardize_filename
+NON_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+# Same replacement as a str.translate table for the ASCII fast path
+FILENAME_TRANSLATION = str.maketrans(
+    {
+        chr(code): "_"
+        for code in range(128)
+        if NON_FILENAME_CHARS.fullmatch(chr(code))
+    }
+)
+
+# AWS error codes worth retrying; anything else is treated as permanent
+RETRYABLE_AWS_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "RequestTimeout",
+        "SlowDown",
+        "ServiceUnavailable",
+        "InternalError",
+        "503",
+    }
+)
+
+
+def aws_is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether an exception from an AWS call is worth retrying.
+
+    :param error: Exception raised by the wrapped call
+    :return: False for ClientErrors with a permanent error code, else True
+    """
+    if not isinstance(error, ClientError):
+        return True
+    return error.response.get("Error", {}).get("Code") in RETRYABLE_AWS_ERROR_CODES
+
 
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: Tuple[type, ...] = (Exception,),
+    is_retryable: Callable[[BaseException], bool] = lambda e: True,
 ) -> Callable:
     """
     Retry decorator with exponential backoff.
 
     :param max_attempts: Maximum number of retry attempts
-    :param delay: Initial delay between retries
+    :param delay: Initial delay between retries, jittered by 0.5-1.5x
     :param backoff: Multiplier for delay between retries
     :param exceptions: Tuple of exceptions to catch and retry
+    :param is_retryable: Predicate on a caught exception; False re-raises it
+        immediately without waiting (e.g. aws_is_retryable)
     :return: Decorated function
     """
 
     def decorator(func: Callable) -> Callable:
+        # Bind the logger once per decorated function, not per call
+        logger = create_logger(func.__module__)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = create_logger(func.__module__)
             current_delay = delay
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -37,11 +81,16 @@ def retry(
                 except exceptions as e:
                     logger.warning(f"Attempt {attempt} failed: {e}")
 
+                    if not is_retryable(e):
+                        logger.error("Error is not retryable, giving up")
+                        raise
+
                     if attempt == max_attempts:
                         logger.error(f"All {max_attempts} attempts failed")
                         raise
 
-                    time.sleep(current_delay)
+                    # Jitter the wait so concurrent callers don't retry in lockstep
+                    time.sleep(current_delay * (0.5 + random.random()))
                     current_delay *= backoff
 
         return wrapper
@@ -57,41 +106,65 @@ def log_aws_initialization_error(error):
     """
     logger = create_logger(__name__)
 
-    # Comprehensive error logging
-    logger.critical(f"AWS S3 Initialization Failed: {error}")
-    logger.critical("Troubleshooting:")
-    logger.critical("1. Verify AWS credentials")
-    logger.critical("2. Check IAM user permissions")
-    logger.critical("3. Ensure AWS IAM user has S3 access")
+    # One multi-line record: a single format and write per failure
+    logger.critical(
+        "AWS S3 Initialization Failed: %s\n"
+        "Troubleshooting:\n"
+        "1. Verify AWS credentials\n"
+        "2. Check IAM user permissions\n"
+        "3. Ensure AWS IAM user has S3 access",
+        error,
+    )
+
+
+def s3_init() -> Tuple[Any, Any]:
+    """
+    Initialize S3 client and session with robust error handling.
+
+    The session and client are built and verified once per process, from the
+    same environment snapshot as config.get_aws_session(). After rotating
+    credentials (e.g. a refreshed AWS_SESSION_TOKEN), call
+    config.reset_env_cache() to rebuild them.
+
+    Always returns a (client, session) pair; worker threads can build their
+    own clients from the shared session.
+
+    :return: Tuple of (S3 client, session)
+    :raises ClientError: If S3 initialization fails
+    """
+    return _cached_s3_client()
+
 
+@functools.lru_cache(maxsize=1)
+def _cached_s3_client() -> Tuple[Any, Any]:
+    """Process-wide cached result of _create_s3_client."""
+    return _create_s3_client()
 
-def s3_init(return_session: bool = False) -> Tuple[Any, Optional[Any]]:
+
+def _create_s3_client() -> Tuple[Any, Any]:
     """
-    Initialize S3 client with robust error handling and optional session return.
+    Create a boto3 session and S3 client and verify access with list_buckets.
 
-    :param return_session: If True, returns both client and session
-    :return: S3 client, and optionally the session
+    :return: Tuple of (S3 client, session)
     :raises ClientError: If S3 initialization fails
     """
     logger = create_logger(__name__)
 
     try:
-        # Comprehensive logging of environment variables
-        logger.info("Checking AWS Environment Variables:")
-        logger.info(
-            f"AWS_ACCESS_KEY_ID: {os.environ.get('AWS_ACCESS_KEY_ID', 'NOT SET')}"
-        )
-        logger.info(
-            f"AWS_SECRET_ACCESS_KEY: {'*' * len(os.environ.get('AWS_SECRET_ACCESS_KEY', '')) or 'NOT SET'}"
-        )
-        logger.info(
-            f"AWS_DEFAULT_REGION: {os.environ.get('AWS_DEFAULT_REGION', 'NOT SET')}"
-        )
-
-        # Validate AWS credentials
-        access_key = os.environ.get("AWS_ACCESS_KEY_ID")
-        secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
-        region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+        # Validate the same snapshot get_aws_session() builds the session from
+        env = _load_env()
+        access_key = env.aws_access_key_id
+        secret_key = env.aws_secret_access_key
+        region = env.aws_default_region
+
+        # Environment variable dump, only built when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking AWS Environment Variables:")
+            logger.debug("AWS_ACCESS_KEY_ID: %s", access_key or "NOT SET")
+            logger.debug(
+                "AWS_SECRET_ACCESS_KEY: %s", "*" * len(secret_key or "") or "NOT SET"
+            )
+            logger.debug("AWS_DEFAULT_REGION: %s", region or "NOT SET")
 
         # Comprehensive credential validation
         if not access_key:
@@ -112,18 +185,21 @@ def s3_init(return_session: bool = False) -> Tuple[Any, Optional[Any]]:
                 "Detected placeholder AWS access key. Please provide a valid key."
             )
 
-        # Create a session with explicit credentials
-        try:
-            session = boto3.Session(
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region,
-            )
+    except ValueError as e:
+        # Configuration problems: log once, then propagate
+        log_aws_initialization_error(e)
+        raise
+
+    # Reuse the session that credential validation already built
+    try:
+        session = get_aws_session()
 
-            # Create S3 client
-            s3_client = session.client("s3")
+        # Create S3 client
+        s3_client = session.client("s3", config=get_boto_client_config())
 
-            # Verify S3 access by attempting a simple operation
+        # Optional S3 access probe; by default the first real S3 call
+        # surfaces bad credentials instead of an extra round-trip here
+        if os.getenv("AWS_VALIDATE_ON_STARTUP", "false").lower() == "true":
             try:
                 # List buckets to verify credentials
                 s3_client.list_buckets()
@@ -149,20 +225,16 @@ def s3_init(return_session: bool = False) -> Tuple[Any, Optional[Any]]:
                 else:
                     raise
 
-            return (s3_client, session) if return_session else s3_client
+        return s3_client, session
 
-        except Exception as session_error:
-            logger.critical(f"Failed to create AWS session: {session_error}")
-            log_aws_initialization_error(session_error)
-            raise
-
-    except (ValueError, ClientError) as e:
-        # Store the error for later handling
-        log_aws_initialization_error(e)
+    except (BotoCoreError, ClientError, ValueError) as session_error:
+        logger.critical(f"Failed to create AWS session: {session_error}")
+        log_aws_initialization_error(session_error)
         raise
 
 
 # File path and naming utilities
+@functools.lru_cache(maxsize=4096)
 def get_filename_from_path(file_path: str) -> str:
     """Extract filename from a given file path.
 
@@ -172,9 +244,14 @@ def get_filename_from_path(file_path: str) -> str:
     Returns:
         Extracted filename without extension
     """
-    return os.path.splitext(os.path.basename(file_path))[0]
+    name = os.path.basename(file_path)
+    # Single scan for the last dot; leading dots (".env") aren't extensions,
+    # matching os.path.splitext
+    stem, dot, _ = name.rpartition(".")
+    return stem if dot and stem.strip(".") else name
 
 
+@functools.lru_cache(maxsize=4096)
 def standardize_filename(filename: str) -> str:
     """Standardize filename by removing special characters.
 
@@ -184,7 +261,36 @@ def standardize_filename(filename: str) -> str:
     Returns:
         Standardized filename with only alphanumeric characters and underscores
     """
-    return re.sub(r"[^a-zA-Z0-9_]", "_", filename).lower()
+    if filename.isascii():
+        return filename.translate(FILENAME_TRANSLATION).lower()
+    return NON_FILENAME_CHARS.sub("_", filename).lower()
+
+
+def _iter_files(directory: str, file_extension: str) -> Iterator[str]:
+    """Yield paths of files under directory ending in file_extension.
+
+    Uses os.scandir, whose directory entries carry their type, so no extra
+    stat call is needed per entry. Paths come out in os.walk's top-down
+    order, so the same file wins when two names standardize alike, and
+    unreadable directories are skipped as os.walk does.
+    """
+    stack = [directory]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # os.walk lists symlinked directories but doesn't enter them
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(file_extension):
+                        yield entry.path
+        except OSError:
+            continue
+
+        # Reversed so the first subdirectory is popped, and walked, first
+        stack.extend(reversed(subdirs))
 
 
 def collect_file_paths(directory: str, file_extension: str) -> Dict[str, str]:
@@ -197,12 +303,9 @@ def collect_file_paths(directory: str, file_extension: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping standardized filenames to full file paths
     """
-    file_paths: Dict[str, str] = {}
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(file_extension):
-                full_path = os.path.join(root, file)
-                filename = get_filename_from_path(file)
-                std_filename = standardize_filename(filename)
-                file_paths[std_filename] = full_path
-    return file_paths
+    # Later paths in walk order win when two names standardize alike;
+    # a missing or unreadable directory yields no paths
+    return {
+        standardize_filename(get_filename_from_path(path)): path
+        for path in _iter_files(directory, file_extension)
+    }